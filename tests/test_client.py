@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from functools import wraps
+from io import BytesIO
 from pathlib import Path
 from unittest import TestCase
 
@@ -41,6 +42,13 @@ class TestClient(TestCase):
     def setUp(self):
         self.client = Client(base_url="https://server", token="test")
 
+    @mock_response(url="https://server/api/issues/1", response_name="issue")
+    def test_context_manager(self):
+        with Client(base_url="https://server", token="test") as client:
+            self.assertEqual(TEST_ISSUE, client.get_issue(issue_id="1"))
+        # closing again is harmless
+        client.close()
+
     @mock_response(url="https://server/api/issues/1", response_name="issue")
     def test_get_issue(self):
         self.assertEqual(
@@ -62,6 +70,81 @@ class TestClient(TestCase):
             self.client.get_issues(model=CustomIssue, custom_fields=["State", "Type"]),
         )
 
+    @mock_response(url="https://server/api/issues/", response_name="issues")
+    def test_get_issues_without_validation(self):
+        result = self.client.get_issues(query="in:TD for:me", validate=False)
+        self.assertEqual(["1-937", "2-48"], [issue.id for issue in result])
+        self.assertIsInstance(result[0], Issue)
+        # values are kept as returned by the server: timestamps stay numeric
+        self.assertEqual(1612879391000, result[0].created)
+
+    @mock_response(url="https://server/api/issues/", response_name="issues")
+    def test_get_issues_raw(self):
+        result = self.client.get_issues_raw(fields="id,idReadable", query="in:TD for:me")
+        self.assertEqual(
+            ["1-937", "2-48"],
+            [issue["id"] for issue in result],
+        )
+
+    @requests_mock.Mocker()
+    def test_iter_issues(self, m):
+        m.register_uri(
+            method="GET",
+            url="https://server/api/issues/",
+            response_list=[
+                {"text": (Path(__file__).parent / "responses" / "issues.json").read_text()},
+                {"text": "[]"},
+            ],
+        )
+        self.assertEqual(
+            (TEST_ISSUE, TEST_ISSUE_2),
+            tuple(self.client.iter_issues(query="in:TD for:me", page_size=2)),
+        )
+
+    @requests_mock.Mocker()
+    def test_get_issues_with_details(self, m):
+        responses = Path(__file__).parent / "responses"
+        m.register_uri(method="GET", url="https://server/api/issues/", text=(responses / "issues.json").read_text())
+        for issue_id in ("1-937", "2-48"):
+            m.register_uri(
+                method="GET",
+                url=f"https://server/api/issues/{issue_id}/comments",
+                text=(responses / "issue_comments.json").read_text(),
+            )
+            m.register_uri(method="GET", url=f"https://server/api/issues/{issue_id}/attachments", text="[]")
+
+        result = self.client.get_issues_with_details(query="in:TD for:me")
+
+        self.assertEqual((TEST_ISSUE, TEST_ISSUE_2), tuple(entry.issue for entry in result))
+        for entry in result:
+            self.assertEqual(self.client.get_issue_comments(issue_id=entry.issue.id), entry.comments)
+            self.assertEqual((), entry.attachments)
+
+    @requests_mock.Mocker()
+    def test_create_issue_attachments(self, m):
+        m.register_uri(method="POST", url="https://server/api/issues/1/attachments", text="[]")
+
+        result = self.client.create_issue_attachments(issue_id="1", files={"demo.txt": BytesIO(b"file content")})
+
+        self.assertEqual((), result)
+        request = m.request_history[0]
+        self.assertTrue(request.headers["Content-Type"].startswith("multipart/form-data"))
+        # the request body is identical with and without the streaming encoder:
+        # the part filename is the dict key and the part type is application/octet-stream
+        body = request.body.read() if hasattr(request.body, "read") else request.body
+        self.assertIn(b'filename="demo.txt"', body)
+        self.assertIn(b"Content-Type: application/octet-stream", body)
+        self.assertIn(b"file content", body)
+
+    @requests_mock.Mocker()
+    def test_bulk_delete_issue_comments(self, m):
+        m.register_uri(method="DELETE", url="https://server/api/issues/1/comments/4-296", text="")
+        m.register_uri(method="DELETE", url="https://server/api/issues/1/comments/4-443", text="")
+
+        self.client.bulk_delete_issue_comments(issue_id="1", comment_ids=("4-296", "4-443"))
+
+        self.assertEqual(2, m.call_count)
+
     @mock_response(url="https://server/api/issues/1/comments", response_name="issue_comments")
     def test_get_issue_comments(self):
         self.assertEqual(
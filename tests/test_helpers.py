@@ -4,7 +4,7 @@ from unittest import TestCase
 from pydantic import Field
 
 from youtrack_sdk.entities import BaseModel
-from youtrack_sdk.helpers import model_to_field_names
+from youtrack_sdk.helpers import construct_obj_as, model_to_field_names
 
 
 class SimpleModel(BaseModel):
@@ -54,3 +54,45 @@ class TestModelToFieldNames(TestCase):
             "$type,id,shortName,value($type,id,shortName)",
             model_to_field_names(Union[SimpleModel | NestedModel]),
         )
+
+
+class TestConstructObjAs(TestCase):
+    def test_none(self):
+        self.assertIsNone(construct_obj_as(SimpleModel, None))
+
+    def test_simple_model(self):
+        self.assertEqual(
+            SimpleModel.construct(type="SimpleModel", id=1, short_name="Demo"),
+            construct_obj_as(SimpleModel, {"$type": "SimpleModel", "id": 1, "shortName": "Demo"}),
+        )
+
+    def test_nested_model(self):
+        self.assertEqual(
+            NestedModel.construct(value=SimpleModel.construct(id=2)),
+            construct_obj_as(NestedModel, {"value": {"id": 2}}),
+        )
+
+    def test_sequence(self):
+        self.assertEqual(
+            (SimpleModel.construct(id=1), SimpleModel.construct(id=2)),
+            construct_obj_as(tuple[SimpleModel, ...], [{"id": 1}, {"id": 2}]),
+        )
+
+    def test_union_discriminator(self):
+        result = construct_obj_as(
+            NestedUnionModel,
+            {
+                "$type": "NestedUnionModel",
+                "items": [{"$type": "SimpleModel", "id": 1}, 5],
+                "entry": {"$type": "NestedModel", "value": {"id": 2}},
+            },
+        )
+        self.assertEqual([SimpleModel.construct(id=1), 5], result.items)
+        self.assertEqual(NestedModel.construct(value=SimpleModel.construct(id=2)), result.entry)
+
+    def test_no_validation(self):
+        # Values are kept as returned by the server: no coercion or validators run.
+        self.assertEqual(
+            "not-an-int",
+            construct_obj_as(SimpleModel, {"id": "not-an-int"}).id,
+        )
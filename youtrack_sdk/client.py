@@ -1,10 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from http import HTTPStatus
 from json import JSONDecodeError
-from typing import IO, Optional, Sequence, Type, TypeVar
+from typing import IO, Any, Iterator, Mapping, NamedTuple, Optional, Sequence, Type, TypeVar
 from urllib.parse import urlencode
 
-from pydantic import parse_obj_as
 from requests import HTTPError, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson parses response bytes directly, without the UTF-8 decode + Python-level
+    # parsing the stdlib incurs. Its JSONDecodeError subclasses the stdlib one.
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+try:
+    # requests-toolbelt streams multipart bodies chunk by chunk; without it, requests
+    # buffers every file into memory to compute the Content-Length itself.
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    # pysimdjson parses lazily: values are materialized only when accessed, which keeps
+    # the memory footprint of large responses close to the size of the JSON bytes.
+    from simdjson import Parser as SimdjsonParser
+except ImportError:
+    SimdjsonParser = None
+
+try:
+    from pydantic import TypeAdapter
+except ImportError:
+    # Pydantic v1 caches the synthetic parsing models used by `parse_obj_as` internally,
+    # so the imported function can be used as-is.
+    from pydantic import parse_obj_as
+else:
+
+    @cache
+    def _type_adapter(type_: Any) -> "TypeAdapter":
+        return TypeAdapter(type_)
+
+    def parse_obj_as(type_: Any, obj: Any) -> Any:
+        # Pydantic v2 compiles a validator per type; build it once and reuse it across calls.
+        return _type_adapter(type_).validate_python(obj)
+
 
 from .entities import (
     BaseModel,
@@ -19,22 +60,83 @@ from .entities import (
     User,
 )
 from .exceptions import YouTrackException, YouTrackNotFound, YouTrackUnauthorized
-from .helpers import model_to_field_names, obj_to_json
+from .helpers import construct_obj_as, model_to_field_names, obj_to_json
 from .types import IssueLinkDirection
 
 T = TypeVar("T", bound=BaseModel)
 
 
+def _build_query_params(
+    fields: Optional[str] = None,
+    offset: Optional[int] = None,
+    count: Optional[int] = None,
+    **kwargs,
+) -> dict:
+    """Collects the non-None query parameters, lowercasing booleans as the API expects."""
+    params = {}
+    if fields is not None:
+        params["fields"] = fields
+    if offset is not None:
+        params["$skip"] = offset
+    if count is not None:
+        params["$top"] = count
+    for key, value in kwargs.items():
+        if value is not None:
+            params[key] = str(value).lower() if isinstance(value, bool) else value
+    return params
+
+
+def _parse_list_response(model: Type[T], result: Any, validate: bool) -> Sequence[T]:
+    if validate:
+        return parse_obj_as(tuple[model, ...], result)
+    return construct_obj_as(tuple[model, ...], result)
+
+
+class IssueWithDetails(NamedTuple):
+    issue: Issue
+    comments: Sequence[IssueComment]
+    attachments: Sequence[IssueAttachment]
+
+
 class Client:
-    def __init__(self, *, base_url: str, token: str):
-        self._base_url = base_url
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        token: str,
+        pool_maxsize: int = 10,
+        max_retries: Optional[Retry | int] = None,
+    ):
+        self._api_base = base_url.rstrip("/") + "/api"
         self._session = Session()
+        if max_retries is None:
+            # Back off and retry on transient failures and throttling; with this
+            # configuration urllib3 only retries idempotent methods, so POSTs are
+            # never replayed. Pass `max_retries=0` to disable retries entirely.
+            max_retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504))
+        # Keep-alive connections are reused across calls; `pool_maxsize` caps how many
+        # connections to the server may be held open at once (e.g. by concurrent callers).
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=max_retries)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._session.headers.update(
             {
                 "Authorization": f"Bearer {token}",
             },
         )
 
+    def close(self):
+        """Closes the underlying session, releasing its pooled keep-alive connections."""
+        self._session.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _build_url(
         self,
         *,
@@ -44,20 +146,8 @@ class Client:
         count: Optional[int] = None,
         **kwargs,
     ) -> str:
-        query = urlencode(
-            {
-                key: str(value).lower() if isinstance(value, bool) else value
-                for key, value in {
-                    "fields": fields,
-                    "$skip": offset,
-                    "$top": count,
-                    **kwargs,
-                }.items()
-                if value is not None
-            },
-            doseq=True,
-        )
-        return f"{self._base_url}/api{path}?{query}"
+        query = urlencode(_build_query_params(fields=fields, offset=offset, count=count, **kwargs), doseq=True)
+        return self._api_base + path + "?" + query
 
     def _send_request(
         self,
@@ -66,14 +156,34 @@ class Client:
         url: str,
         data: Optional[BaseModel] = None,
         files: Optional[dict[str, IO]] = None,
-    ) -> Optional[dict]:
-        response = self._session.request(
-            method=method,
-            url=url,
-            data=data and obj_to_json(data),
-            files=files,
-            headers=data and {"Content-Type": "application/json"},
-        )
+        raw: bool = False,
+    ) -> Optional[dict | bytes]:
+        if data is not None and files is not None:
+            raise ValueError("`data` and `files` cannot be combined in a single request")
+
+        if files is not None:
+            # The part filename is always the dict key and the part content type is always
+            # application/octet-stream, whether or not the streaming encoder is available.
+            parts = {name: (name, file, "application/octet-stream") for name, file in files.items()}
+            if MultipartEncoder is not None:
+                encoder = MultipartEncoder(fields=parts)
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                )
+            else:
+                response = self._session.request(method=method, url=url, files=parts)
+        elif data is not None:
+            response = self._session.request(
+                method=method,
+                url=url,
+                data=obj_to_json(data),
+                headers=self._JSON_HEADERS,
+            )
+        else:
+            response = self._session.request(method=method, url=url)
 
         if response.status_code == HTTPStatus.NOT_FOUND:
             raise YouTrackNotFound
@@ -87,13 +197,16 @@ class Client:
                     f"Unexpected status code for {method} {url}: {response.status_code}.",
                 ) from e
 
+        if raw:
+            return response.content
+
         # Avoid JSONDecodeError if status code was 2xx, but the response content is empty.
         # Some API endpoints return empty, non-JSON responses on success.
         if len(response.content) == 0:
             return
 
         try:
-            return response.json()
+            return loads(response.content)
         except JSONDecodeError as e:
             raise YouTrackException(
                 f"Failed to decode response from {method} {url}, status={response.status_code}",
@@ -141,14 +254,19 @@ class Client:
         custom_fields: Sequence[str] = (),
         offset: int = 0,
         count: int = -1,
+        validate: bool = True,
     ) -> Sequence[T]:
         """Get all issues that match the specified query.
         If you don't provide the query parameter, the server returns all issues.
 
+        Pass `validate=False` to build the models with `construct` instead of running
+        full Pydantic validation: the response is trusted to match the schema and values
+        are kept as returned by the server (e.g. timestamps stay numeric).
+
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues.html#get_all-Issue-method
         """
-        return parse_obj_as(
-            tuple[model, ...],
+        return _parse_list_response(
+            model,
             self._get(
                 url=self._build_url(
                     path="/issues/",
@@ -159,8 +277,107 @@ class Client:
                     count=count,
                 ),
             ),
+            validate,
         )
 
+    def get_issues_raw(
+        self,
+        *,
+        fields: Optional[str] = None,
+        query: Optional[str] = None,
+        custom_fields: Sequence[str] = (),
+        offset: int = 0,
+        count: int = -1,
+    ) -> Sequence[Mapping]:
+        """Get all issues that match the specified query, skipping model validation.
+
+        Returns the decoded JSON array as-is: plain dicts in a list, or — when pysimdjson
+        is installed — lazy read-only proxy objects that materialize only the values
+        actually accessed, useful for callers that pick one field out of huge responses.
+        Both support mapping-style element access; mutate a copy if changes are needed.
+        Pass `fields` to restrict the response to the attributes needed; it defaults to
+        the full Issue field set.
+        """
+        content = self._send_request(
+            method="GET",
+            url=self._build_url(
+                path="/issues/",
+                fields=fields or model_to_field_names(Issue),
+                query=query,
+                customFields=custom_fields,
+                offset=offset,
+                count=count,
+            ),
+            raw=True,
+        )
+        if SimdjsonParser is not None:
+            return SimdjsonParser().parse(content)
+        return loads(content)
+
+    def iter_issues(
+        self,
+        *,
+        model: Type[T] = Issue,
+        query: Optional[str] = None,
+        custom_fields: Sequence[str] = (),
+        page_size: int = 100,
+    ) -> Iterator[T]:
+        """Iterate over all issues that match the specified query, fetching them page by page.
+
+        The next page is requested in the background while the current one is being parsed
+        and consumed, overlapping network latency with caller processing. A page shorter
+        than `page_size` marks the end of the result set.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+
+            def fetch(offset: int):
+                return executor.submit(
+                    self.get_issues,
+                    model=model,
+                    query=query,
+                    custom_fields=custom_fields,
+                    offset=offset,
+                    count=page_size,
+                )
+
+            future = fetch(0)
+            offset = page_size
+            while True:
+                page = future.result()
+                if len(page) == page_size:
+                    future = fetch(offset)
+                    offset += page_size
+                else:
+                    future = None
+                yield from page
+                if future is None:
+                    return
+
+    def get_issues_with_details(
+        self,
+        *,
+        query: Optional[str] = None,
+        custom_fields: Sequence[str] = (),
+        offset: int = 0,
+        count: int = -1,
+        max_workers: int = 8,
+    ) -> Sequence[IssueWithDetails]:
+        """Get all issues that match the specified query together with their comments and attachments.
+
+        The per-issue comment and attachment requests are independent, so they are fetched
+        concurrently over the pooled session instead of one round-trip at a time.
+        `max_workers` caps the number of requests in flight.
+        """
+        issues = self.get_issues(query=query, custom_fields=custom_fields, offset=offset, count=count)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            comments = [executor.submit(self.get_issue_comments, issue_id=issue.id) for issue in issues]
+            attachments = [executor.submit(self.get_issue_attachments, issue_id=issue.id) for issue in issues]
+            return tuple(
+                IssueWithDetails(issue=issue, comments=issue_comments.result(), attachments=issue_attachments.result())
+                for issue, issue_comments, issue_attachments in zip(issues, comments, attachments)
+            )
+
     def create_issue(self, *, issue: Issue) -> Issue:
         """Create new issue.
 
@@ -242,13 +459,20 @@ class Client:
             ),
         )
 
-    def get_issue_comments(self, *, issue_id: str, offset: int = 0, count: int = -1) -> Sequence[IssueComment]:
+    def get_issue_comments(
+        self,
+        *,
+        issue_id: str,
+        offset: int = 0,
+        count: int = -1,
+        validate: bool = True,
+    ) -> Sequence[IssueComment]:
         """Get all accessible comments of the specific issue.
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issues-issueID-comments.html#get_all-IssueComment-method
         """
-        return parse_obj_as(
-            tuple[IssueComment, ...],
+        return _parse_list_response(
+            IssueComment,
             self._get(
                 url=self._build_url(
                     path=f"/issues/{issue_id}/comments",
@@ -257,6 +481,7 @@ class Client:
                     count=count,
                 ),
             ),
+            validate,
         )
 
     def create_issue_comment(self, *, issue_id: str, comment: IssueComment) -> IssueComment:
@@ -294,7 +519,14 @@ class Client:
 
         https://www.jetbrains.com/help/youtrack/devportal/operations-api-issues-issueID-comments.html#update-IssueComment-method
         """
-        self.update_issue_comment(issue_id=issue_id, comment=(IssueComment(id=comment_id, deleted=True)))
+        # Posts the update directly instead of going through `update_issue_comment`:
+        # the caller discards the result, so there is no point requesting the full
+        # comment back via `fields` and validating it into a model.
+        # `construct` skips validation, which a fixed two-field literal does not need.
+        self._post(
+            url=self._build_url(path=f"/issues/{issue_id}/comments/{comment_id}"),
+            data=IssueComment.construct(id=comment_id, deleted=True),
+        )
 
     def delete_issue_comment(self, *, issue_id: str, comment_id: str):
         """Delete a specific issue comment.
@@ -307,6 +539,21 @@ class Client:
             ),
         )
 
+    def bulk_delete_issue_comments(self, *, issue_id: str, comment_ids: Sequence[str], max_workers: int = 8):
+        """Delete multiple comments of the specific issue.
+
+        The DELETE requests are independent, so they are issued concurrently over the
+        pooled session instead of paying one sequential round-trip per comment.
+        `max_workers` caps the number of requests in flight.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.delete_issue_comment, issue_id=issue_id, comment_id=comment_id)
+                for comment_id in comment_ids
+            ]
+            for future in futures:
+                future.result()
+
     def get_issue_attachments(self, *, issue_id: str, offset: int = 0, count: int = -1) -> Sequence[IssueAttachment]:
         """Get a list of all attachments of the specific issue.
 
@@ -359,13 +606,13 @@ class Client:
             ),
         )
 
-    def get_projects(self, offset: int = 0, count: int = -1) -> Sequence[Project]:
+    def get_projects(self, offset: int = 0, count: int = -1, validate: bool = True) -> Sequence[Project]:
         """Get a list of all available projects in the system.
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-admin-projects.html#get_all-Project-method
         """
-        return parse_obj_as(
-            tuple[Project, ...],
+        return _parse_list_response(
+            Project,
             self._get(
                 url=self._build_url(
                     path="/admin/projects",
@@ -374,15 +621,16 @@ class Client:
                     count=count,
                 ),
             ),
+            validate,
         )
 
-    def get_tags(self, offset: int = 0, count: int = -1) -> Sequence[IssueTag]:
+    def get_tags(self, offset: int = 0, count: int = -1, validate: bool = True) -> Sequence[IssueTag]:
         """Get all tags that are visible to the current user.
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-issueTags.html#get_all-IssueTag-method
         """
-        return parse_obj_as(
-            tuple[IssueTag, ...],
+        return _parse_list_response(
+            IssueTag,
             self._get(
                 url=self._build_url(
                     path="/issueTags",
@@ -391,6 +639,7 @@ class Client:
                     count=count,
                 ),
             ),
+            validate,
         )
 
     def add_issue_tag(self, *, issue_id: str, tag: IssueTag):
@@ -401,13 +650,13 @@ class Client:
             data=tag,
         )
 
-    def get_users(self, offset: int = 0, count: int = -1) -> Sequence[User]:
+    def get_users(self, offset: int = 0, count: int = -1, validate: bool = True) -> Sequence[User]:
         """Read the list of users in YouTrack.
 
         https://www.jetbrains.com/help/youtrack/devportal/resource-api-users.html#get_all-User-method
         """
-        return parse_obj_as(
-            tuple[User, ...],
+        return _parse_list_response(
+            User,
             self._get(
                 url=self._build_url(
                     path="/users",
@@ -416,6 +665,7 @@ class Client:
                     count=count,
                 ),
             ),
+            validate,
         )
 
     def get_issue_links(self, issue_id: str, offset: int = 0, count: int = -1) -> Sequence[IssueLink]:
@@ -1,11 +1,18 @@
 import json
 from copy import deepcopy
 from datetime import date, datetime, time, timezone
+from functools import cache
 from itertools import starmap
-from typing import Any, Optional, Type, Union, get_args
+from types import UnionType
+from typing import Any, Optional, Type, Union, get_args, get_origin
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def deep_update(dest: dict, *mappings: dict) -> dict:
     """Recursively updates `dest` with `mappings`.
@@ -36,9 +43,13 @@ def deep_update(dest: dict, *mappings: dict) -> dict:
     return result
 
 
+@cache
 def model_to_field_names(model: Type[BaseModel] | Union[Type[BaseModel]]) -> Optional[str]:
     """Parses model and returns field names as a comma separated string.
 
+    The result depends only on the model type, so it is memoized:
+    repeated client calls reuse the string computed on the first request.
+
     If a field has an alias, it will be used as a field name. If a field accepts different type(s),
     they will be parsed recursively and found field names combined to remove duplicates.
     Field names from a referenced models will be mentioned as a subset of an original field in parentheses::
@@ -84,33 +95,116 @@ def obj_to_dict(obj: Optional[BaseModel]) -> Optional[dict]:
     Converts pydantic model instance to dictionary including nested fields.
     Unset fields or fields without default values will be omitted.
     """
-    # `exclude_none=True` on its own is not sufficient, because it should be possible
-    # to set a field to None explicitly (e.g. to unassign a ticket).
-    # `exclude_unset=True` on its own is not sufficient, because the default value
-    # for $type fields should be used to simplify the creation of request objects.
-    return obj and deep_update(
-        obj.dict(by_alias=True, exclude_unset=True),
-        obj.dict(by_alias=True, exclude_none=True),
-    )
+
+    # A field is included when it was set explicitly (so it is possible to set a field
+    # to None, e.g. to unassign a ticket) or when its value is not None (so the default
+    # value for $type fields is kept to simplify the creation of request objects).
+    # Checking `__fields_set__` directly lets a single traversal replace the previous
+    # `exclude_unset`/`exclude_none` double `.dict()` pass and recursive merge.
+    def convert(value: Any) -> Any:
+        match value:
+            case BaseModel():
+                return model_to_dict(value)
+            case list() | tuple():
+                return [convert(item) for item in value]
+            case _:
+                return value
+
+    def model_to_dict(model: BaseModel) -> dict:
+        result = {}
+        for name, field in model.__fields__.items():
+            value = getattr(model, name)
+            if name in model.__fields_set__ or value is not None:
+                result[field.alias] = convert(value)
+        return result
+
+    return obj and model_to_dict(obj)
+
+
+def _resolve_union_member(type_: Any, value: Any) -> Any:
+    """Selects the union member matching the `$type` discriminator of the value.
+
+    Falls back to the first member when the value carries no discriminator
+    or no member declares a matching `type` field default.
+    """
+    members = [member for member in get_args(type_) if member is not type(None)]
+
+    if isinstance(value, dict) and (value_type := value.get("$type")) is not None:
+        for member in members:
+            if isinstance(member, type) and issubclass(member, BaseModel):
+                type_field = member.__fields__.get("type")
+                if type_field is not None and type_field.default == value_type:
+                    return member
+
+    return members[0]
+
+
+def construct_obj_as(type_: Any, value: Any) -> Any:
+    """Builds model instance(s) from API data without validation.
+
+    Nested models and sequences are constructed recursively and aliases are resolved,
+    but no type coercion or validators run: values are kept exactly as returned by
+    the server (e.g. timestamps stay numeric), so the data is trusted to match the
+    schema. Union members are selected by the `$type` discriminator.
+    """
+    if value is None:
+        return None
+
+    origin = get_origin(type_)
+
+    # both `Union[X, Y]` and PEP 604 `X | Y` spellings are used across the models
+    if origin is Union or origin is UnionType:
+        return construct_obj_as(_resolve_union_member(type_, value), value)
+
+    if origin is not None and isinstance(value, list):
+        item_type = get_args(type_)[0]
+        items = (construct_obj_as(item_type, item) for item in value)
+        return tuple(items) if origin is tuple else list(items)
+
+    if isinstance(type_, type) and issubclass(type_, BaseModel) and isinstance(value, dict):
+        values = {}
+        for name, field in type_.__fields__.items():
+            if field.alias in value:
+                values[name] = construct_obj_as(field.outer_type_, value[field.alias])
+            elif name in value:
+                values[name] = construct_obj_as(field.outer_type_, value[name])
+        return type_.construct(_fields_set=set(values), **values)
+
+    return value
+
+
+def to_youtrack_timestamp(value: date | datetime) -> int:
+    """Converts a date or datetime to a YouTrack timestamp (Unix epoch milliseconds).
+
+    Dates without a time component are pinned to noon UTC.
+    """
+    match value:
+        case datetime():
+            dt = value
+        case date():
+            dt = datetime.combine(value, time(hour=12, tzinfo=timezone.utc))
+        case _:
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    return int(dt.timestamp() * 1000)
 
 
 class YouTrackTimestampEncoder(json.JSONEncoder):
     def default(self, obj):
-        def to_youtrack_timestamp(dt: datetime) -> int:
-            return int(dt.timestamp() * 1000)
-
         match obj:
-            case datetime():
-                return to_youtrack_timestamp(obj)
             case date():
-                return to_youtrack_timestamp(datetime.combine(obj, time(hour=12, tzinfo=timezone.utc)))
+                return to_youtrack_timestamp(obj)
             case _:
                 return json.JSONEncoder.default(self, obj)
 
 
-def custom_json_dumps(obj: Any) -> str:
+def custom_json_dumps(obj: Any) -> str | bytes:
+    if orjson is not None:
+        # `OPT_PASSTHROUGH_DATETIME` routes date/datetime values through `default`,
+        # so they are encoded as YouTrack timestamps instead of ISO 8601 strings.
+        return orjson.dumps(obj, default=to_youtrack_timestamp, option=orjson.OPT_PASSTHROUGH_DATETIME)
     return json.dumps(obj, cls=YouTrackTimestampEncoder, allow_nan=False)
 
 
-def obj_to_json(obj: Optional[BaseModel]) -> str:
+def obj_to_json(obj: Optional[BaseModel]) -> str | bytes:
     return custom_json_dumps(obj_to_dict(obj))